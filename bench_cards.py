@@ -0,0 +1,136 @@
+"""Time rebuilding the station list with 500 cards.
+
+Run with: python bench_cards.py [count]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from main import APP_STYLESHEET, StationCardPool
+from PySide6.QtCore import QEvent, Qt, Signal
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QApplication, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+
+class LegacyStationCard(QWidget):
+    """The station card as it was before the shared stylesheet, with its inline CSS"""
+    station_clicked = Signal(dict)
+
+    def __init__(self, station):
+        super().__init__()
+        self.station = station
+        self.setFixedHeight(80)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setStyleSheet("""
+            QWidget {
+                background: #f8f9fa; border: 1px solid #dee2e6; border-radius: 8px; margin: 2px;
+            }
+            QWidget:hover { background: #e9ecef; border-color: #007bff; }
+        """)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(12, 8, 12, 8)
+
+        icon = QLabel("RADIO")
+        icon.setFont(QFont("Arial", 10, QFont.Bold))
+        icon.setFixedSize(40, 40)
+        icon.setAlignment(Qt.AlignCenter)
+        icon.setStyleSheet("background: #007bff; border-radius: 20px; color: white;")
+
+        details = QVBoxLayout()
+        name = QLabel(station.get('name', 'Unknown'))
+        name.setFont(QFont("Arial", 11, QFont.Bold))
+        name.setStyleSheet("color: #212529;")
+
+        info_parts = [station.get('country', 'Unknown')]
+        if station.get('genre'):
+            info_parts.append(station.get('genre'))
+        if station.get('bitrate', 0) > 0:
+            info_parts.append(f"{station.get('bitrate')}k")
+
+        info = QLabel(" | ".join(info_parts))
+        info.setFont(QFont("Arial", 9))
+        info.setStyleSheet("color: #6c757d;")
+
+        details.addWidget(name)
+        details.addWidget(info)
+
+        play_btn = QPushButton("Play")
+        play_btn.setFixedSize(45, 28)
+        play_btn.setStyleSheet("""
+            QPushButton { background: #28a745; color: white; border: none; border-radius: 4px; font-size: 10px; font-weight: bold; }
+            QPushButton:hover { background: #218838; }
+        """)
+        play_btn.clicked.connect(lambda: self.station_clicked.emit(self.station))
+
+        layout.addWidget(icon)
+        layout.addLayout(details)
+        layout.addStretch()
+        layout.addWidget(play_btn)
+
+
+def make_stations(count, tag):
+    return [{'name': f"{tag} Station {i}", 'url': f"http://example.com/{tag}/{i}",
+             'country': 'Israel', 'genre': 'Pop', 'bitrate': 128} for i in range(count)]
+
+
+def make_list():
+    widget = QWidget()
+    widget.setObjectName("stationList")
+    layout = QVBoxLayout(widget)
+    layout.setSpacing(5)
+    layout.addStretch()
+    widget.resize(800, 600)
+    widget.show()
+    return widget, layout
+
+
+def rebuild(layout, stations):
+    """Clear and recreate every legacy card, as the list used to do"""
+    for i in reversed(range(layout.count() - 1)):
+        item = layout.takeAt(i)
+        if item.widget():
+            item.widget().deleteLater()
+    for station in stations:
+        layout.insertWidget(layout.count() - 1, LegacyStationCard(station))
+
+
+def measure(app, fn, rounds):
+    times = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        fn(i)
+        # No event loop runs here, so deleteLater() would never fire on its own
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+        app.processEvents()  # include polish and layout
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times), sum(times) / len(times)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rounds = 5
+    app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
+    batches = [make_stations(count, "A"), make_stations(count, "B")]
+
+    _, layout = make_list()
+    best, mean = measure(app, lambda i: rebuild(layout, batches[i % 2]), rounds)
+    print(f"legacy rebuild {count} cards: best {best:8.1f} ms  mean {mean:8.1f} ms")
+
+    _, layout = make_list()
+    pool = StationCardPool(lambda station: None)
+    pool.fill(layout, batches[1])
+    app.processEvents()
+    best, mean = measure(app, lambda i: pool.fill(layout, batches[i % 2]), rounds)
+    print(f"pooled fill    {count} cards: best {best:8.1f} ms  mean {mean:8.1f} ms")
+
+    small = batches[0][:40]
+    best, mean = measure(app, lambda i: pool.fill(layout, small if i % 2 == 0 else batches[1]), rounds)
+    print(f"pooled 40<->{count}    cards: best {best:8.1f} ms  mean {mean:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
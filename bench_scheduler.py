@@ -0,0 +1,78 @@
+"""Measure scheduler timer accuracy and the cost of each scheduled job.
+
+Run with: python bench_scheduler.py [jobs] [seconds]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+from main import ScheduleDB, Scheduler
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    spread = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+
+    threads_before = threading.active_count()
+    scheduler = Scheduler()
+    scheduler.start()
+
+    lateness = []
+    done = threading.Event()
+
+    def fire(when):
+        lateness.append((time.time() - when) * 1000)
+        if len(lateness) == jobs:
+            done.set()
+
+    # Memory held by the pending jobs
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.time() + 1.0
+    for i in range(jobs):
+        when = start + spread * i / jobs
+        scheduler.add(when, fire, when)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    job_bytes = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    threads = threading.active_count() - threads_before
+
+    # CPU spent while waiting for and firing the jobs
+    cpu_start = time.process_time()
+    done.wait(spread + 10)
+    cpu = time.process_time() - cpu_start
+    scheduler.stop()
+
+    print(f"jobs:            {jobs} over {spread:.1f} s")
+    print(f"threads used:    {threads}")
+    print(f"memory per job:  {job_bytes / jobs:.0f} bytes")
+    print(f"cpu per job:     {cpu / jobs * 1e6:.1f} us")
+    print(f"lateness (ms):   mean {sum(lateness) / len(lateness):.2f}  p50 {percentile(lateness, 0.5):.2f}  "
+          f"p99 {percentile(lateness, 0.99):.2f}  max {max(lateness):.2f}")
+
+    # Cost of persisting and reloading jobs
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    db = ScheduleDB(path)
+    station = {'name': 'Bench', 'url': 'http://example.com/stream'}
+    t = time.perf_counter()
+    for i in range(200):
+        db.add('alarm', station, datetime.now(), 0)
+    add_ms = (time.perf_counter() - t) * 1000 / 200
+    t = time.perf_counter()
+    pending = db.get_pending()
+    load_ms = (time.perf_counter() - t) * 1000
+    os.remove(path)
+    print(f"sqlite:          {add_ms:.2f} ms per insert, {load_ms:.2f} ms to load {len(pending)} jobs")
+
+
+if __name__ == "__main__":
+    main()
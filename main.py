@@ -6,6 +6,12 @@ import os
 import tempfile
 import uuid
 import time
+import queue
+import heapq
+import hashlib
+import argparse
+import itertools
+from collections import OrderedDict
 from datetime import datetime
 
 # Audio initialization
@@ -25,69 +31,253 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 
 
+APP_STYLESHEET = """
+    QScrollArea#stationScroll { border: none; background: white; }
+    QWidget#stationList { background: white; }
+    StationCard { background: #f8f9fa; border: 1px solid #dee2e6; border-radius: 8px; margin: 2px; }
+    StationCard:hover { background: #e9ecef; border-color: #007bff; }
+    QLabel#stationIcon { background: #007bff; border-radius: 20px; color: white; }
+    QLabel#stationName { color: #212529; }
+    QLabel#stationInfo { color: #6c757d; }
+    QPushButton#stationPlay { background: #28a745; color: white; border: none; border-radius: 4px; font-size: 10px; font-weight: bold; }
+    QPushButton#stationPlay:hover { background: #218838; }
+    QListWidget#scheduleList { border: none; background: white; font-size: 12px; }
+    QListWidget#scheduleList::item { padding: 8px; border-bottom: 1px solid #e5e7eb; }
+"""
+
+
 class StationCard(QWidget):
     station_clicked = Signal(dict)
 
-    def __init__(self, station):
+    def __init__(self, station=None, logos=None):
         super().__init__()
-        self.station = station
+        self.station = {}
+        self.logos = logos
+        self.logo_url = ''
+        self.setAttribute(Qt.WA_StyledBackground, True)
         self.setFixedHeight(80)
         self.setCursor(Qt.PointingHandCursor)
-        self.setStyleSheet("""
-            QWidget {
-                background: #f8f9fa; border: 1px solid #dee2e6; border-radius: 8px; margin: 2px;
-            }
-            QWidget:hover { background: #e9ecef; border-color: #007bff; }
-        """)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
 
         # Icon
-        icon = QLabel("RADIO")
-        icon.setFont(QFont("Arial", 10, QFont.Bold))
-        icon.setFixedSize(40, 40)
-        icon.setAlignment(Qt.AlignCenter)
-        icon.setStyleSheet("background: #007bff; border-radius: 20px; color: white;")
+        self.icon = QLabel("RADIO")
+        self.icon.setObjectName("stationIcon")
+        self.icon.setFont(QFont("Arial", 10, QFont.Bold))
+        self.icon.setFixedSize(40, 40)
+        self.icon.setAlignment(Qt.AlignCenter)
 
         # Details
         details = QVBoxLayout()
-        name = QLabel(station.get('name', 'Unknown'))
-        name.setFont(QFont("Arial", 11, QFont.Bold))
-        name.setStyleSheet("color: #212529;")
-
-        info_parts = [station.get('country', 'Unknown')]
-        if station.get('genre'):
-            info_parts.append(station.get('genre'))
-        if station.get('bitrate', 0) > 0:
-            info_parts.append(f"{station.get('bitrate')}k")
+        self.name_label = QLabel()
+        self.name_label.setObjectName("stationName")
+        self.name_label.setFont(QFont("Arial", 11, QFont.Bold))
 
-        info = QLabel(" | ".join(info_parts))
-        info.setFont(QFont("Arial", 9))
-        info.setStyleSheet("color: #6c757d;")
+        self.info_label = QLabel()
+        self.info_label.setObjectName("stationInfo")
+        self.info_label.setFont(QFont("Arial", 9))
 
-        details.addWidget(name)
-        details.addWidget(info)
+        details.addWidget(self.name_label)
+        details.addWidget(self.info_label)
 
         # Play button
         play_btn = QPushButton("Play")
+        play_btn.setObjectName("stationPlay")
         play_btn.setFixedSize(45, 28)
-        play_btn.setStyleSheet("""
-            QPushButton { background: #28a745; color: white; border: none; border-radius: 4px; font-size: 10px; font-weight: bold; }
-            QPushButton:hover { background: #218838; }
-        """)
         play_btn.clicked.connect(lambda: self.station_clicked.emit(self.station))
 
-        layout.addWidget(icon)
+        layout.addWidget(self.icon)
         layout.addLayout(details)
         layout.addStretch()
         layout.addWidget(play_btn)
 
+        if logos is not None:
+            logos.logo_ready.connect(self.on_logo_ready)
+        if station is not None:
+            self.set_station(station)
+
+    def set_station(self, station):
+        """Show another station in this card, so cards can be reused"""
+        self.station = station
+        self.name_label.setText(station.get('name', 'Unknown'))
+
+        info_parts = [station.get('country', 'Unknown')]
+        if station.get('genre'):
+            info_parts.append(station.get('genre'))
+        if station.get('bitrate', 0) > 0:
+            info_parts.append(f"{station.get('bitrate')}k")
+        self.info_label.setText(" | ".join(info_parts))
+
+        self.logo_url = station.get('favicon', '')
+        pixmap = None
+        if self.logos is not None and self.logo_url.startswith(('http://', 'https://')):
+            pixmap = self.logos.get(self.logo_url)
+        self.show_logo(pixmap)
+
+    def show_logo(self, pixmap):
+        if pixmap is not None:
+            self.icon.setPixmap(pixmap)
+        else:
+            self.icon.setText("RADIO")
+
+    def on_logo_ready(self, url):
+        if url == self.logo_url:
+            self.show_logo(self.logos.get(url))
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.station_clicked.emit(self.station)
 
 
+class StationCardPool:
+    """Keeps station cards alive between refreshes instead of rebuilding them"""
+
+    def __init__(self, on_click, logos=None):
+        self.on_click = on_click
+        self.logos = logos
+        self.free = []
+
+    def acquire(self, station):
+        if self.free:
+            card = self.free.pop()
+            card.set_station(station)
+        else:
+            card = StationCard(station, self.logos)
+            card.station_clicked.connect(self.on_click)
+        return card
+
+    def release(self, card):
+        card.hide()
+        self.free.append(card)
+
+    def fill(self, layout, stations):
+        """Show stations in a layout ending with a stretch, reusing the cards already in it"""
+        container = layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            count = layout.count() - 1
+            for i, station in enumerate(stations):
+                if i < count:
+                    layout.itemAt(i).widget().set_station(station)
+                else:
+                    card = self.acquire(station)
+                    layout.insertWidget(layout.count() - 1, card)
+                    card.show()
+
+            # Return leftover cards to the pool
+            for i in reversed(range(len(stations), count)):
+                self.release(layout.takeAt(i).widget())
+        finally:
+            container.setUpdatesEnabled(True)
+
+
+class LogoFetcher(QThread):
+    fetched = Signal(str, bytes)
+
+    def __init__(self, cache_dir, max_bytes):
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.urls = queue.Queue()
+        self.should_stop = False
+
+    def run(self):
+        while not self.should_stop:
+            url = self.urls.get()
+            if url is None or self.should_stop:
+                break
+            self.fetched.emit(url, self.load(url))
+
+    def load(self, url):
+        """Read a logo from the disk cache, downloading it on a miss"""
+        path = os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+        try:
+            if os.path.exists(path):
+                os.utime(path, None)  # mark as recently used
+                with open(path, 'rb') as f:
+                    return f.read()
+
+            response = requests.get(url, timeout=5, headers={'User-Agent': 'RadioPlayer/1.0'})
+            if response.status_code != 200 or len(response.content) > 256 * 1024:
+                return b''
+            with open(path, 'wb') as f:
+                f.write(response.content)
+            self.trim()
+            return response.content
+        except Exception:
+            return b''
+
+    def trim(self):
+        """Delete least recently used logos until the cache fits in max_bytes"""
+        try:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                os.remove(path)
+                total -= size
+        except OSError:
+            pass
+
+    def stop(self):
+        """Drop queued logos and block until the thread has exited"""
+        self.should_stop = True
+        try:
+            while True:
+                self.urls.get_nowait()
+        except queue.Empty:
+            pass
+        self.urls.put(None)
+        self.wait()  # at most one in-flight download (5 s timeout)
+
+
+class LogoCache(QObject):
+    logo_ready = Signal(str)
+
+    def __init__(self, cache_dir=None, max_pixmaps=256, max_disk_bytes=20 * 1024 * 1024):
+        super().__init__()
+        if cache_dir is None:
+            cache_dir = os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "logos")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_pixmaps = max_pixmaps
+        self.pixmaps = OrderedDict()
+        self.pending = set()
+        self.failed = set()
+        self.fetcher = LogoFetcher(cache_dir, max_disk_bytes)
+        self.fetcher.fetched.connect(self.on_fetched)
+        self.fetcher.start()
+
+    def get(self, url):
+        """Return the cached pixmap for url, or None and fetch it in the background"""
+        if url in self.pixmaps:
+            self.pixmaps.move_to_end(url)
+            return self.pixmaps[url]
+        if url not in self.pending and url not in self.failed:
+            self.pending.add(url)
+            self.fetcher.urls.put(url)
+        return None
+
+    def on_fetched(self, url, data):
+        self.pending.discard(url)
+        pixmap = QPixmap()
+        if not data or not pixmap.loadFromData(data):
+            self.failed.add(url)
+            return
+        self.pixmaps[url] = pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if len(self.pixmaps) > self.max_pixmaps:
+            self.pixmaps.popitem(last=False)
+        self.logo_ready.emit(url)
+
+    def stop(self):
+        self.fetcher.stop()
+
+
 class RadioAPI(QThread):
     data_ready = Signal(list)
     load_error = Signal(str)
@@ -118,7 +308,8 @@ class RadioAPI(QThread):
                             'url': url.strip(),
                             'country': s.get('country', 'Unknown').strip(),
                             'genre': s.get('tags', 'Music').split(',')[0].strip().title() or 'Music',
-                            'bitrate': int(s.get('bitrate', 0) or 0)
+                            'bitrate': int(s.get('bitrate', 0) or 0),
+                            'favicon': (s.get('favicon') or '').strip()
                         })
                 self.data_ready.emit(valid)
             else:
@@ -134,6 +325,7 @@ class AudioPlayer:
         self.should_stop = False
         self.current_url = None
         self.stream_thread = None
+        self.recordings = {}
 
     def play(self, url):
         try:
@@ -296,6 +488,49 @@ class AudioPlayer:
 
         self.current_url = None
 
+    RECORDING_EXTENSIONS = {
+        'audio/mpeg': '.mp3', 'audio/mp3': '.mp3',
+        'audio/aac': '.aac', 'audio/aacp': '.aac', 'audio/x-aac': '.aac',
+        'audio/ogg': '.ogg', 'application/ogg': '.ogg', 'audio/opus': '.opus',
+        'audio/flac': '.flac', 'audio/x-flac': '.flac',
+    }
+
+    def record(self, key, url, base_path):
+        """Save the stream at url until stop_recording(key) is called.
+
+        The file holds the raw stream bytes as the server sends them; its
+        extension is picked from the response Content-Type (.mp3 if unknown).
+        """
+        self.stop_recording(key)
+        stop_event = threading.Event()
+        self.recordings[key] = stop_event
+        threading.Thread(target=self._record_stream, args=(url, base_path, stop_event), daemon=True).start()
+
+    def _record_stream(self, url, base_path, stop_event):
+        try:
+            response = requests.get(url, headers={'User-Agent': 'RadioPlayer/1.0', 'Accept-Encoding': 'identity'},
+                                    stream=True, timeout=15)
+            if response.status_code != 200:
+                print(f"Recording failed: HTTP {response.status_code}")
+                return
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            path = base_path + self.RECORDING_EXTENSIONS.get(content_type, '.mp3')
+            print(f"Recording {url} to {path}")
+            with open(path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    if stop_event.is_set():
+                        break
+                    if chunk:
+                        f.write(chunk)
+            response.close()
+        except Exception as e:
+            print(f"Recording failed: {e}")
+
+    def stop_recording(self, key):
+        stop_event = self.recordings.pop(key, None)
+        if stop_event:
+            stop_event.set()
+
     def set_volume(self, volume):
         self.volume = volume
         if AUDIO_ENABLED and self.playing:
@@ -325,15 +560,23 @@ class FavoritesDB:
                                 genre
                                 TEXT,
                                 added_when
+                                TEXT,
+                                favicon
                                 TEXT
                             )""")
+            # Databases created before logos were cached lack the favicon column
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(favorites)")]
+            if 'favicon' not in columns:
+                conn.execute("ALTER TABLE favorites ADD COLUMN favicon TEXT")
 
     def add(self, station):
         try:
             with sqlite3.connect(self.db) as conn:
-                conn.execute("INSERT OR IGNORE INTO favorites VALUES (NULL,?,?,?,?,?)",
+                conn.execute("INSERT OR IGNORE INTO favorites (name, url, country, genre, added_when, favicon) "
+                             "VALUES (?,?,?,?,?,?)",
                              (station['name'], station['url'], station['country'],
-                              station['genre'], datetime.now().strftime('%Y-%m-%d %H:%M')))
+                              station['genre'], datetime.now().strftime('%Y-%m-%d %H:%M'),
+                              station.get('favicon', '')))
             return True
         except:
             return False
@@ -358,20 +601,391 @@ class FavoritesDB:
             with sqlite3.connect(self.db) as conn:
                 conn.row_factory = sqlite3.Row
                 rows = conn.execute("SELECT * FROM favorites ORDER BY added_when DESC").fetchall()
-                return [{'name': r['name'], 'url': r['url'], 'country': r['country'], 'genre': r['genre']} for r in
-                        rows]
+                return [{'name': r['name'], 'url': r['url'], 'country': r['country'], 'genre': r['genre'],
+                         'favicon': r['favicon'] or ''} for r in rows]
+        except:
+            return []
+
+
+class ScheduleDB:
+    TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+    INPUT_FORMAT = '%Y-%m-%d %H:%M'
+
+    def __init__(self, db="favorites.db"):
+        self.db = db
+        with sqlite3.connect(self.db) as conn:
+            conn.execute("""CREATE TABLE IF NOT EXISTS schedules
+                            (
+                                id INTEGER PRIMARY KEY,
+                                kind TEXT,
+                                name TEXT,
+                                url TEXT,
+                                start_at TEXT,
+                                minutes INTEGER,
+                                status TEXT,
+                                claimed_at REAL
+                            )""")
+
+    def add(self, kind, station, start_at, minutes):
+        try:
+            with sqlite3.connect(self.db) as conn:
+                cursor = conn.execute("INSERT INTO schedules VALUES (NULL,?,?,?,?,?,'pending',NULL)",
+                                      (kind, station['name'], station['url'],
+                                       start_at.strftime(self.TIME_FORMAT), minutes))
+                return cursor.lastrowid
+        except:
+            return None
+
+    @classmethod
+    def parse_time(cls, text):
+        """Parse a stored or typed start time; seconds are optional"""
+        try:
+            return datetime.strptime(text, cls.TIME_FORMAT)
+        except ValueError:
+            return datetime.strptime(text, cls.INPUT_FORMAT)
+
+    def set_status(self, job_id, status):
+        try:
+            with sqlite3.connect(self.db) as conn:
+                conn.execute("UPDATE schedules SET status=? WHERE id=?", (status, job_id))
+            return True
+        except:
+            return False
+
+    def claim(self, job_id, stale_before):
+        """Mark a job as running unless another process holds a claim newer than stale_before"""
+        try:
+            with sqlite3.connect(self.db) as conn:
+                cursor = conn.execute("UPDATE schedules SET status='running', claimed_at=? WHERE id=? AND "
+                                      "(status='pending' OR (status='running' AND "
+                                      "(claimed_at IS NULL OR claimed_at < ?)))",
+                                      (time.time(), job_id, stale_before))
+                return cursor.rowcount == 1
+        except:
+            return False
+
+    def touch(self, job_ids):
+        """Refresh the claims on jobs this process is running"""
+        try:
+            with sqlite3.connect(self.db) as conn:
+                now = time.time()
+                conn.executemany("UPDATE schedules SET claimed_at=? WHERE id=?", [(now, i) for i in job_ids])
+            return True
+        except:
+            return False
+
+    def remove(self, job_id):
+        try:
+            with sqlite3.connect(self.db) as conn:
+                conn.execute("DELETE FROM schedules WHERE id=?", (job_id,))
+            return True
+        except:
+            return False
+
+    def get_pending(self):
+        try:
+            with sqlite3.connect(self.db) as conn:
+                conn.row_factory = sqlite3.Row
+                rows = conn.execute("SELECT * FROM schedules WHERE status IN ('pending', 'running') "
+                                    "ORDER BY start_at").fetchall()
+                return [dict(r) for r in rows]
         except:
             return []
 
 
+class Scheduler:
+    """Runs callbacks at wall-clock times from one heap, on a single thread"""
+
+    MAX_WAIT = 30  # re-check the clock at least this often, in case it jumps
+
+    def __init__(self):
+        self.heap = []
+        self.entries = {}  # key -> heap entry, for jobs that have not fired yet
+        self.counter = itertools.count()
+        self.cond = threading.Condition()
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        with self.cond:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+        if self.thread:
+            self.thread.join(timeout=2)
+
+    def add(self, when, callback, *args):
+        """Call callback(*args) at the time.time() value when; returns a key for cancel()"""
+        key = next(self.counter)
+        entry = [when, key, callback, args]
+        with self.cond:
+            self.entries[key] = entry
+            heapq.heappush(self.heap, entry)
+            if self.heap[0][1] == key:
+                self.cond.notify()  # new earliest job
+        return key
+
+    def cancel(self, key):
+        """Cancel a pending callback; keys that already fired are ignored"""
+        with self.cond:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                entry[2] = None  # dropped when it reaches the top of the heap
+
+    def _next_due(self):
+        """Wait for and pop the next due entry, or return None once stopped"""
+        with self.cond:
+            while self.running:
+                if not self.heap:
+                    self.cond.wait()
+                    continue
+                when, key, callback = self.heap[0][:3]
+                if callback is None:
+                    heapq.heappop(self.heap)
+                    continue
+                delay = when - time.time()
+                if delay > 0:
+                    self.cond.wait(min(delay, self.MAX_WAIT))
+                    continue
+                del self.entries[key]
+                return heapq.heappop(self.heap)
+            return None
+
+    def _run(self):
+        while True:
+            entry = self._next_due()
+            if entry is None:
+                break
+            when, key, callback, args = entry
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Scheduled job failed: {e}")
+
+
+class RadioScheduler:
+    """Starts the alarms and recordings stored in ScheduleDB when they are due
+
+    The table is re-read every POLL_INTERVAL seconds so jobs added by another
+    process are picked up, and each job is claimed in the database before it
+    runs so a GUI and a headless process never both run it.
+    """
+
+    MISSED_GRACE = 60  # seconds an alarm without a duration may start late
+    POLL_INTERVAL = 10
+    CLAIM_TIMEOUT = 3 * POLL_INTERVAL  # a claim not refreshed for this long is abandoned
+
+    def __init__(self, audio, db=None, recordings_dir="recordings", on_change=None):
+        self.audio = audio
+        self.db = db or ScheduleDB()
+        self.recordings_dir = recordings_dir
+        self.on_change = on_change  # called as on_change(job, event) from the timer thread
+        self.timer = Scheduler()
+        self.lock = threading.RLock()
+        self.keys = {}
+        self.active = set()
+        self.elsewhere = set()  # jobs claimed by another process
+
+    def start(self):
+        self.timer.start()
+        self.refresh()
+
+    def stop(self):
+        self.timer.stop()
+        with self.lock:
+            for job_id in self.active:
+                self.audio.stop_recording(job_id)
+                self.db.set_status(job_id, 'pending')  # let another process take over
+            self.active.clear()
+
+    def refresh(self):
+        """Sync armed jobs with the database and keep our claims alive"""
+        with self.lock:
+            now = time.time()
+            self.db.touch(self.active)
+            jobs = self.db.get_pending()
+            for job in jobs:
+                if job['id'] in self.keys or job['id'] in self.active:
+                    continue
+                if job['id'] in self.elsewhere:
+                    if job['status'] == 'running' and (job['claimed_at'] or 0) >= now - self.CLAIM_TIMEOUT:
+                        continue
+                    self.elsewhere.discard(job['id'])
+                self.arm(job)
+
+            # Drop jobs that were cancelled or finished by another process
+            ids = {job['id'] for job in jobs}
+            for job_id in [i for i in self.keys if i not in ids]:
+                for key in self.keys.pop(job_id):
+                    self.timer.cancel(key)
+                if job_id in self.active:
+                    self.active.discard(job_id)
+                    self.audio.stop_recording(job_id)
+            self.elsewhere &= ids
+        self.timer.add(now + self.POLL_INTERVAL, self.refresh)
+
+    def notify(self, job, event):
+        if self.on_change:
+            self.on_change(job, event)
+
+    def is_missed(self, start_at, minutes, now=None):
+        now = now or time.time()
+        if minutes < 0:
+            return True  # a window that ends before it starts can never run
+        if minutes:
+            return start_at.timestamp() + minutes * 60 <= now
+        return start_at.timestamp() < now - self.MISSED_GRACE
+
+    def add(self, kind, station, start_at, minutes):
+        """Save and arm a job; returns its id, or None if it is invalid, already missed or could not be saved"""
+        if minutes < 0 or self.is_missed(start_at, minutes):
+            return None
+        # A job whose window is already open runs its full length from now
+        start_at = max(start_at, datetime.now().replace(microsecond=0))
+        with self.lock:
+            job_id = self.db.add(kind, station, start_at, minutes)
+            if job_id is not None:
+                self.arm({'id': job_id, 'kind': kind, 'name': station['name'], 'url': station['url'],
+                          'start_at': start_at.strftime(ScheduleDB.TIME_FORMAT), 'minutes': minutes})
+            return job_id
+
+    def cancel(self, job_id):
+        with self.lock:
+            for key in self.keys.pop(job_id, []):
+                self.timer.cancel(key)
+            if job_id in self.active:
+                self.active.discard(job_id)
+                self.audio.stop_recording(job_id)
+            self.db.remove(job_id)
+
+    def arm(self, job):
+        if job['id'] in self.keys:
+            return
+        start_at = ScheduleDB.parse_time(job['start_at'])
+        start = start_at.timestamp()
+        end = start + job['minutes'] * 60
+        now = time.time()
+        if self.is_missed(start_at, job['minutes'], now):
+            print(f"Missed scheduled {job['kind']}: {job['name']}")
+            self.db.set_status(job['id'], 'missed')
+            self.notify(job, 'missed')
+            return
+
+        # Jobs whose window is already open (e.g. after a restart) start right away
+        keys = [self.timer.add(max(start, now), self.begin, job)]
+        if job['minutes']:
+            keys.append(self.timer.add(end, self.finish, job))
+        self.keys[job['id']] = keys
+        print(f"Scheduled {job['kind']}: {job['name']} at {job['start_at']}")
+        self.notify(job, 'scheduled')
+
+    def begin(self, job):
+        with self.lock:
+            if job['id'] not in self.keys:
+                return  # cancelled
+            if not self.db.claim(job['id'], time.time() - self.CLAIM_TIMEOUT):
+                print(f"Scheduled {job['kind']} of {job['name']} is running in another process")
+                for key in self.keys.pop(job['id']):
+                    self.timer.cancel(key)
+                self.elsewhere.add(job['id'])
+                return
+
+            print(f"Starting scheduled {job['kind']}: {job['name']}")
+            self.active.add(job['id'])
+            if job['kind'] == 'record':
+                os.makedirs(self.recordings_dir, exist_ok=True)
+                safe_name = "".join(c if c.isalnum() else "_" for c in job['name'])[:40]
+                base_path = os.path.join(self.recordings_dir,
+                                         f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{job['id']}")
+                self.audio.record(job['id'], job['url'], base_path)
+                self.notify(job, 'started')
+            else:
+                self.audio.play(job['url'])
+                self.notify(job, 'started')
+                if not job['minutes']:
+                    self.finish(job)
+
+    def finish(self, job):
+        with self.lock:
+            self.keys.pop(job['id'], None)
+            if job['id'] not in self.active:
+                return
+            self.active.discard(job['id'])
+            if job['kind'] == 'record':
+                self.audio.stop_recording(job['id'])
+            elif job['minutes'] and self.audio.current_url == job['url']:
+                self.audio.stop()
+            self.db.set_status(job['id'], 'done')
+            print(f"Finished scheduled {job['kind']}: {job['name']}")
+            self.notify(job, 'finished')
+
+
+class ScheduleDialog(QDialog):
+    def __init__(self, station, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Schedule")
+
+        form = QFormLayout(self)
+
+        self.kind = QComboBox()
+        self.kind.addItems(["Alarm", "Record"])
+        self.kind.currentIndexChanged.connect(self.on_kind_changed)
+
+        self.start_at = QDateTimeEdit(QDateTime.currentDateTime().addSecs(3600))
+        self.start_at.setDisplayFormat("yyyy-MM-dd HH:mm")
+        self.start_at.setCalendarPopup(True)
+
+        self.minutes = QSpinBox()
+        self.minutes.setRange(0, 24 * 60)
+        self.minutes.setValue(60)
+        self.minutes.setSuffix(" min")
+        self.minutes.setSpecialValueText("Until stopped")
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        form.addRow("Station", QLabel(station.get('name', 'Unknown')))
+        form.addRow("Type", self.kind)
+        form.addRow("Start", self.start_at)
+        form.addRow("Duration", self.minutes)
+        form.addRow(buttons)
+
+    def on_kind_changed(self, index):
+        # Only alarms can run until stopped; otherwise a 1 min recording would read "Until stopped"
+        recording = index == 1
+        self.minutes.setSpecialValueText("" if recording else "Until stopped")
+        self.minutes.setMinimum(1 if recording else 0)
+
+    def values(self):
+        # The editor only shows minutes; drop the seconds it keeps from its initial value
+        start_at = self.start_at.dateTime().toPython().replace(second=0, microsecond=0)
+        return self.kind.currentText().lower(), start_at, self.minutes.value()
+
+
 class RadioPlayer(QMainWindow):
+    schedule_changed = Signal(dict, str)
+
     def __init__(self):
         super().__init__()
         self.stations = []
         self.current_station = None
         self.audio = AudioPlayer()
         self.db = FavoritesDB()
+        self.logos = LogoCache()
+        self.card_pool = StationCardPool(self.play_station, self.logos)
+        # Scheduler callbacks run on its own thread; the signal queues them to the GUI thread
+        self.scheduler = RadioScheduler(self.audio, on_change=self.schedule_changed.emit)
+        self.schedule_changed.connect(self.on_schedule_changed)
         self.setup_ui()
+        self.scheduler.start()
         threading.Timer(0.5, self.load_stations).start()
 
     def setup_ui(self):
@@ -461,9 +1075,10 @@ class RadioPlayer(QMainWindow):
         self.stations_scroll = QScrollArea()
         self.stations_scroll.setWidgetResizable(True)
         self.stations_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.stations_scroll.setStyleSheet("border: none; background: white;")
+        self.stations_scroll.setObjectName("stationScroll")
 
         self.stations_widget = QWidget()
+        self.stations_widget.setObjectName("stationList")
         self.stations_layout = QVBoxLayout(self.stations_widget)
         self.stations_layout.setSpacing(5)
         self.stations_layout.addStretch()
@@ -484,9 +1099,10 @@ class RadioPlayer(QMainWindow):
         self.favorites_scroll = QScrollArea()
         self.favorites_scroll.setWidgetResizable(True)
         self.favorites_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.favorites_scroll.setStyleSheet("border: none; background: white;")
+        self.favorites_scroll.setObjectName("stationScroll")
 
         self.favorites_widget = QWidget()
+        self.favorites_widget.setObjectName("stationList")
         self.favorites_layout = QVBoxLayout(self.favorites_widget)
         self.favorites_layout.setSpacing(5)
         self.favorites_layout.addStretch()
@@ -495,8 +1111,35 @@ class RadioPlayer(QMainWindow):
         favorites_layout.addWidget(favorites_title)
         favorites_layout.addWidget(self.favorites_scroll)
 
+        # Schedule tab
+        schedule_tab = QWidget()
+        schedule_layout = QVBoxLayout(schedule_tab)
+        schedule_layout.setContentsMargins(15, 15, 15, 15)
+
+        schedule_header = QHBoxLayout()
+        schedule_title = QLabel("Alarms & Recordings")
+        schedule_title.setFont(QFont("Arial", 16, QFont.Bold))
+        schedule_title.setStyleSheet("color: #1f2937;")
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setStyleSheet(
+            "QPushButton { background: #ef4444; color: white; border: none; border-radius: 5px; padding: 6px 12px; font-weight: bold; }")
+        cancel_btn.clicked.connect(self.cancel_scheduled)
+
+        schedule_header.addWidget(schedule_title)
+        schedule_header.addStretch()
+        schedule_header.addWidget(cancel_btn)
+
+        self.schedule_list = QListWidget()
+        self.schedule_list.setObjectName("scheduleList")
+
+        schedule_layout.addLayout(schedule_header)
+        schedule_layout.addWidget(self.schedule_list)
+
         self.tabs.addTab(stations_tab, "Stations")
         self.tabs.addTab(favorites_tab, "Favorites")
+        self.tabs.addTab(schedule_tab, "Schedule")
+        self.tabs.currentChanged.connect(lambda i: self.load_schedule())
 
         # Player controls
         player = QWidget()
@@ -537,6 +1180,12 @@ class RadioPlayer(QMainWindow):
             "QPushButton { background: #f59e0b; color: white; border: none; border-radius: 16px; font-weight: bold; }")
         self.fav_btn.clicked.connect(self.toggle_favorite)
 
+        timer_btn = QPushButton("TIMER")
+        timer_btn.setFixedSize(60, 32)
+        timer_btn.setStyleSheet(
+            "QPushButton { background: #8b5cf6; color: white; border: none; border-radius: 16px; font-weight: bold; }")
+        timer_btn.clicked.connect(self.schedule_station)
+
         # Volume
         self.volume_slider = QSlider(Qt.Horizontal)
         self.volume_slider.setRange(0, 100)
@@ -557,6 +1206,7 @@ class RadioPlayer(QMainWindow):
         player_layout.addWidget(self.play_btn)
         player_layout.addWidget(stop_btn)
         player_layout.addWidget(self.fav_btn)
+        player_layout.addWidget(timer_btn)
         player_layout.addWidget(self.volume_slider)
         player_layout.addWidget(self.vol_label)
 
@@ -567,17 +1217,7 @@ class RadioPlayer(QMainWindow):
         self.statusBar().showMessage("Ready!")
 
     def display_stations(self, stations, target_layout):
-        # Clear existing
-        for i in reversed(range(target_layout.count() - 1)):
-            item = target_layout.takeAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Add new stations
-        for station in stations[:50]:  # Limit to 50
-            card = StationCard(station)
-            card.station_clicked.connect(self.play_station)
-            target_layout.insertWidget(target_layout.count() - 1, card)
+        self.card_pool.fill(target_layout, stations[:50])  # Limit to 50
 
     def load_stations(self):
         self.statusBar().showMessage("Loading...")
@@ -607,13 +1247,14 @@ class RadioPlayer(QMainWindow):
         self.station_counter.setText(f"{len(stations)} results")
         self.statusBar().showMessage(f"Found {len(stations)} stations")
 
-    def play_station(self, station):
+    def show_now_playing(self, station):
         self.current_station = station
-        name = station.get('name', 'Unknown')
-        info = f"{station.get('country', '')} • {station.get('genre', '')}"
+        self.now_playing.setText(station.get('name', 'Unknown'))
+        self.station_info.setText(f"{station.get('country', '')} • {station.get('genre', '')}")
 
-        self.now_playing.setText(name)
-        self.station_info.setText(info)
+    def play_station(self, station):
+        self.show_now_playing(station)
+        name = station.get('name', 'Unknown')
 
         print(f"Playing station: {name}")
         print(f"URL: {station.get('url', '')}")
@@ -664,6 +1305,55 @@ class RadioPlayer(QMainWindow):
         favorites = self.db.get_all()
         self.display_stations(favorites, self.favorites_layout)
 
+    def schedule_station(self):
+        if not self.current_station:
+            self.statusBar().showMessage("Select a station to schedule")
+            return
+        dialog = ScheduleDialog(self.current_station, self)
+        if dialog.exec():
+            kind, start_at, minutes = dialog.values()
+            if self.scheduler.is_missed(start_at, minutes):
+                self.statusBar().showMessage(f"Not scheduled: {start_at.strftime(ScheduleDB.INPUT_FORMAT)} has passed")
+            elif self.scheduler.add(kind, self.current_station, start_at, minutes) is not None:
+                self.statusBar().showMessage(f"Scheduled {kind} at {start_at.strftime(ScheduleDB.INPUT_FORMAT)}")
+            else:
+                self.statusBar().showMessage("Scheduling failed")
+            self.load_schedule()
+
+    def cancel_scheduled(self):
+        item = self.schedule_list.currentItem()
+        if item:
+            self.scheduler.cancel(item.data(Qt.UserRole))
+            self.load_schedule()
+            self.statusBar().showMessage("Schedule cancelled")
+
+    def load_schedule(self):
+        self.schedule_list.clear()
+        for job in self.scheduler.db.get_pending():
+            duration = f"{job['minutes']} min" if job['minutes'] else "until stopped"
+            item = QListWidgetItem(f"{job['start_at']}   {job['kind'].upper()}   {job['name']}   ({duration})")
+            item.setData(Qt.UserRole, job['id'])
+            self.schedule_list.addItem(item)
+
+    def on_schedule_changed(self, job, event):
+        self.load_schedule()
+        if job['kind'] == 'record':
+            if event in ('started', 'finished'):
+                self.statusBar().showMessage(f"Recording {event}: {job['name']}")
+            return
+
+        if event == 'started':
+            known = [s for s in self.stations + self.db.get_all() if s.get('url') == job['url']]
+            station = known[0] if known else {'name': job['name'], 'url': job['url'], 'country': '', 'genre': ''}
+            self.show_now_playing(station)
+            self.play_btn.setText("Pause")
+            self.fav_btn.setText("UNFAV" if self.db.is_favorite(station) else "FAV")
+            self.statusBar().showMessage(f"Alarm: {job['name']}")
+        elif event == 'finished' and job['minutes'] and self.audio.current_url is None:
+            # The alarm's window ended and nothing else was started meanwhile
+            self.play_btn.setText("Play")
+            self.statusBar().showMessage(f"Alarm finished: {job['name']}")
+
     def play_random(self):
         if self.stations:
             import random
@@ -671,15 +1361,73 @@ class RadioPlayer(QMainWindow):
 
     def closeEvent(self, event):
         try:
+            self.scheduler.stop()
             self.audio.stop()
+            self.logos.stop()
             event.accept()
         except:
             event.accept()
 
 
+def run_headless(args):
+    """Add a scheduled job and/or run the scheduler without a window"""
+    audio = AudioPlayer()
+    scheduler = RadioScheduler(audio)
+
+    if args.alarm or args.record:
+        matches = [f for f in FavoritesDB().get_all() if f['name'].lower() == (args.station or '').lower()]
+        if not matches:
+            print(f"No favorite station named: {args.station}")
+            return 1
+        kind = 'alarm' if args.alarm else 'record'
+        try:
+            start_at = ScheduleDB.parse_time(args.alarm or args.record)
+        except ValueError:
+            print(f"Start time must look like {datetime.now().strftime(ScheduleDB.INPUT_FORMAT)}")
+            return 1
+        if args.minutes < 0:
+            print("--minutes can't be negative")
+            return 1
+        if kind == 'record' and args.minutes == 0:
+            print("Recordings need --minutes")
+            return 1
+        if scheduler.is_missed(start_at, args.minutes):
+            print(f"Not scheduled: {start_at.strftime(ScheduleDB.INPUT_FORMAT)} has passed")
+            return 1
+        if scheduler.add(kind, matches[0], start_at, args.minutes) is None:
+            print("Scheduling failed")
+            return 1
+        print(f"Scheduled {kind} of {matches[0]['name']} at {start_at.strftime(ScheduleDB.INPUT_FORMAT)}")
+
+    if not args.headless:
+        return 0
+
+    scheduler.start()
+    print(f"Scheduler running with {len(scheduler.keys)} jobs, Ctrl+C to quit")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    scheduler.stop()
+    audio.stop()
+    return 0
+
+
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Radio Player")
+    parser.add_argument('--headless', action='store_true', help="run scheduled alarms and recordings without a window")
+    parser.add_argument('--alarm', metavar='"YYYY-MM-DD HH:MM"', help="schedule a wake-up alarm")
+    parser.add_argument('--record', metavar='"YYYY-MM-DD HH:MM"', help="schedule a recording")
+    parser.add_argument('--station', help="name of a favorite station to schedule")
+    parser.add_argument('--minutes', type=int, default=0, help="how long to play or record")
+    args, qt_args = parser.parse_known_args()
+    if args.headless or args.alarm or args.record:
+        return run_headless(args)
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setApplicationName("Radio Player")
+    app.setStyleSheet(APP_STYLESHEET)
 
     player = RadioPlayer()
     player.show()